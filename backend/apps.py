@@ -0,0 +1,12 @@
+from django.contrib.admin.apps import AdminConfig
+
+
+class SuperuserAdminConfig(AdminConfig):
+    """Install SuperuserAdminSite as the default admin site.
+
+    Swapping the site class here (instead of mutating admin.site.__class__
+    at import time) keeps every existing register() call working and avoids
+    the import-order footgun.
+    """
+
+    default_site = "core.admin.SuperuserAdminSite"
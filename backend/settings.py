@@ -17,7 +17,7 @@ ALLOWED_HOSTS = os.environ.get("ALLOWED_HOSTS", "localhost,127.0.0.1").split(","
 
 
 INSTALLED_APPS = [
-    "django.contrib.admin",
+    "backend.apps.SuperuserAdminConfig",  # django.contrib.admin with our site
     "django.contrib.auth",
     "django.contrib.contenttypes",
     "django.contrib.sessions",
@@ -37,6 +37,8 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
+    # Compresses large JSON responses (the OpenAPI schema is ~100-500KB)
+    "django.middleware.gzip.GZipMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
@@ -95,6 +97,17 @@ else:
         }
     }
 
+# Explicit local-memory cache sized for the embedding entries the trends
+# analyzer stores with timeout=None: the implicit default caps MAX_ENTRIES
+# at 300 and would cull the long tail of repeated search queries, forcing
+# needless re-encoding RPCs.
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "OPTIONS": {"MAX_ENTRIES": 50_000},
+    }
+}
+
 AUTH_USER_MODEL = "users.User"
 
 AUTH_PASSWORD_VALIDATORS = [
@@ -182,3 +195,6 @@ LOGGING = {
 GOOGLE_CLOUD_PROJECT = os.environ.get("GOOGLE_CLOUD_PROJECT")
 VERTEX_AI_LOCATION = os.environ.get("VERTEX_AI_LOCATION", "us-central1")
 VERTEX_AI_MODEL = os.environ.get("VERTEX_AI_MODEL", "text-multilingual-embedding-002")
+# Warm the analyzer on a background thread at startup instead of paying
+# vertexai.init on the first request
+TRENDS_WARMUP_ASYNC = os.environ.get("TRENDS_WARMUP_ASYNC") == "1"
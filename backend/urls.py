@@ -1,6 +1,7 @@
 from django.contrib import admin
 from django.shortcuts import redirect
 from django.urls import include, path
+from django.views.decorators.cache import cache_page
 from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView
 
 from datasets.moderator_admin import moderator_admin_site
@@ -13,16 +14,28 @@ urlpatterns = [
         "api/v1/",
         include(
             [
-                path("schema/", SpectacularAPIView.as_view(), name="api-schema"),
+                # Hot prefixes first: the resolver tries patterns in order,
+                # so the un-prefixed core include goes last to avoid
+                # descending into it for every other api/v1 request.
+                path("datasets/", include("datasets.urls")),
+                path("users/", include("users.urls")),
+                path("trends/", include("trends.urls")),
+                # The schema is rebuilt from DRF introspection on every hit,
+                # so cache the rendered responses; the schema only changes on
+                # deploy.
+                path(
+                    "schema/",
+                    cache_page(60 * 60)(SpectacularAPIView.as_view()),
+                    name="api-schema",
+                ),
                 path(
                     "docs/",
-                    SpectacularSwaggerView.as_view(url_name="api-schema"),
+                    cache_page(60 * 60)(
+                        SpectacularSwaggerView.as_view(url_name="api-schema")
+                    ),
                     name="api-docs",
                 ),
                 path("", include("core.urls")),
-                path("users/", include("users.urls")),
-                path("datasets/", include("datasets.urls")),
-                path("trends/", include("trends.urls")),
             ]
         ),
     ),
@@ -1,4 +1,3 @@
-from django.contrib import admin
 from django.contrib.admin import AdminSite
 from django.http import HttpRequest
 
@@ -6,13 +5,17 @@ from django.http import HttpRequest
 class SuperuserAdminSite(AdminSite):
     """Custom admin site that only allows superusers"""
 
+    site_header = "Admin Dashboard (Superusers Only)"
+    site_title = "Admin Portal"
+    index_title = "Site Administration"
+
     def has_permission(self, request: HttpRequest) -> bool:
         """Only allow superusers to access /admin/"""
-        return request.user.is_active and request.user.is_superuser
-
-
-# Override the default admin site
-admin.site.__class__ = SuperuserAdminSite
-admin.site.site_header = "Admin Dashboard (Superusers Only)"
-admin.site.site_title = "Admin Portal"
-admin.site.index_title = "Site Administration"
+        # Called once per ModelAdmin/menu item on a page render; memoize the
+        # result on the request so the lazy user is only touched once.
+        cached: bool | None = getattr(request, "_superuser_admin_perm", None)
+        if cached is not None:
+            return cached
+        allowed = request.user.is_active and request.user.is_superuser
+        request._superuser_admin_perm = allowed  # type: ignore[attr-defined]
+        return allowed
@@ -1,11 +1,11 @@
 import base64
 import json
 import os
+from functools import lru_cache
 from typing import TypedDict
 
-from dotenv import load_dotenv
-
-load_dotenv()
+# .env is loaded once by backend.settings at process start; re-running
+# load_dotenv here would stat and parse the file a second time on import.
 
 
 class GoogleServiceAccount(TypedDict):
@@ -22,53 +22,79 @@ class GoogleServiceAccount(TypedDict):
     universe_domain: str | None
 
 
+@lru_cache(maxsize=1)
+def _gcp_key() -> GoogleServiceAccount:
+    """Parse the GCP service account key once per process.
+
+    Handles file path, base64, or plain JSON.
+    """
+    gcp_key = os.environ.get("GCP_SERVICE_ACCOUNT_KEY", "").strip()
+
+    if gcp_key and os.path.isfile(gcp_key):
+        with open(gcp_key) as f:
+            gcp_key = f.read()
+    elif gcp_key and not gcp_key.startswith("{"):
+        try:
+            gcp_key = base64.b64decode(gcp_key).decode("utf-8")
+        except Exception:
+            gcp_key = "{}"
+    elif not gcp_key:
+        gcp_key = "{}"
+
+    info: GoogleServiceAccount = json.loads(gcp_key)
+    return info
+
+
+@lru_cache(maxsize=1)
+def _load_env() -> dict[str, str | None]:
+    """Read configuration env vars once per process."""
+    env = os.environ
+    return {
+        "GOOGLE_CLIENT_ID": env.get("GOOGLE_CLIENT_ID"),
+        "GOOGLE_CLIENT_SECRET": env.get("GOOGLE_CLIENT_SECRET"),
+        "GOOGLE_REDIRECT_URI": env.get(
+            "GOOGLE_REDIRECT_URI", "http://localhost:8000/api/v1/users/google/callback/"
+        ),
+        "GOOGLE_AUTH_SCOPE": env.get("GOOGLE_AUTH_SCOPE", "email,profile"),
+        "FRONTEND_URL": env.get("FRONTEND_URL", "http://localhost:3000"),
+        "JWT_ACCESS_TOKEN_SECRET": env.get("JWT_ACCESS_TOKEN_SECRET", "jwt-secret-key"),
+        "JWT_ENCRYPTION_METHOD": env.get("JWT_ENCRYPTION_METHOD", "HS256"),
+        "BUCKET_NAME": env.get("BUCKET_NAME"),
+        "MAILGUN_API_KEY": env.get("MAILGUN_API_KEY"),
+        "MAILGUN_DOMAIN": env.get("MAILGUN_DOMAIN"),
+    }
+
+
 class Config:
     GOOGLE_CLIENT_ID: str | None
     GOOGLE_CLIENT_SECRET: str | None
     GOOGLE_REDIRECT_URI: str | None
-    GOOGLE_AUTH_SCOPE: list[str]
+    GOOGLE_AUTH_SCOPE: tuple[str, ...]
     FRONTEND_URL: str | None
     JWT_ACCESS_TOKEN_SECRET: str | None
     JWT_ENCRYPTION_METHOD: str | None
-    GOOGLE_SERVICE_ACCOUNT_INFO = GoogleServiceAccount | None
+    GOOGLE_SERVICE_ACCOUNT_INFO: GoogleServiceAccount
     BUCKET_NAME: str | None
     MAILGUN_API_KEY: str | None
     MAILGUN_DOMAIN: str | None
 
     def __init__(self) -> None:
-        self.GOOGLE_CLIENT_ID = os.getenv("GOOGLE_CLIENT_ID")
-        self.GOOGLE_CLIENT_SECRET = os.getenv("GOOGLE_CLIENT_SECRET")
-        self.GOOGLE_REDIRECT_URI = os.getenv(
-            "GOOGLE_REDIRECT_URI", "http://localhost:8000/api/v1/users/google/callback/"
-        )
-        self.GOOGLE_AUTH_SCOPE = os.getenv("GOOGLE_AUTH_SCOPE", "email,profile").split(
-            ","
+        env = _load_env()
+        self.GOOGLE_CLIENT_ID = env["GOOGLE_CLIENT_ID"]
+        self.GOOGLE_CLIENT_SECRET = env["GOOGLE_CLIENT_SECRET"]
+        self.GOOGLE_REDIRECT_URI = env["GOOGLE_REDIRECT_URI"]
+        # Immutable so accidental downstream mutation can't propagate; the
+        # filter drops the [""] a blank env var would otherwise produce.
+        self.GOOGLE_AUTH_SCOPE = tuple(
+            s for s in (env["GOOGLE_AUTH_SCOPE"] or "").split(",") if s
         )
-        self.FRONTEND_URL = os.getenv("FRONTEND_URL", "http://localhost:3000")
-        self.JWT_ACCESS_TOKEN_SECRET = os.getenv(
-            "JWT_ACCESS_TOKEN_SECRET", "jwt-secret-key"
-        )
-        self.JWT_ENCRYPTION_METHOD = os.getenv("JWT_ENCRYPTION_METHOD", "HS256")
-
-        # Handles file path, base64, or plain JSON
-        gcp_key = os.getenv("GCP_SERVICE_ACCOUNT_KEY", "").strip()
-
-        if gcp_key and os.path.isfile(gcp_key):
-            with open(gcp_key) as f:
-                gcp_key = f.read()
-        elif gcp_key and not gcp_key.startswith("{"):
-            try:
-                gcp_key = base64.b64decode(gcp_key).decode("utf-8")
-            except Exception:
-                gcp_key = "{}"
-        elif not gcp_key:
-            gcp_key = "{}"
-
-        self.GOOGLE_SERVICE_ACCOUNT_INFO = json.loads(gcp_key)
-
-        self.BUCKET_NAME = os.getenv("BUCKET_NAME")
-        self.MAILGUN_API_KEY = os.getenv("MAILGUN_API_KEY")
-        self.MAILGUN_DOMAIN = os.getenv("MAILGUN_DOMAIN")
+        self.FRONTEND_URL = env["FRONTEND_URL"]
+        self.JWT_ACCESS_TOKEN_SECRET = env["JWT_ACCESS_TOKEN_SECRET"]
+        self.JWT_ENCRYPTION_METHOD = env["JWT_ENCRYPTION_METHOD"]
+        self.GOOGLE_SERVICE_ACCOUNT_INFO = _gcp_key()
+        self.BUCKET_NAME = env["BUCKET_NAME"]
+        self.MAILGUN_API_KEY = env["MAILGUN_API_KEY"]
+        self.MAILGUN_DOMAIN = env["MAILGUN_DOMAIN"]
 
 
 application_config = Config()
@@ -8,32 +8,54 @@ from rest_framework.views import exception_handler
 logger = logging.getLogger(__name__)
 
 
+def _handle_value_error(exc: Exception) -> Response:
+    return Response(
+        {
+            "error": "invalid_parameters",
+            "message": "Invalid query parameters",
+            "details": {"parameter_error": str(exc)},
+        },
+        status=status.HTTP_400_BAD_REQUEST,
+    )
+
+
+def _handle_import_error(exc: Exception) -> Response:
+    return Response(
+        {
+            "error": "dependency_error",
+            "message": "A required dependency is not installed",
+            "details": {"missing_dependency": str(exc)},
+        },
+        status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+    )
+
+
+# Exact-type dispatch for the common cases: one dict lookup instead of a
+# chain of isinstance checks plus an unconditional DRF handler pass.
+_FAST_HANDLERS = {
+    ValueError: _handle_value_error,
+    ImportError: _handle_import_error,
+    ModuleNotFoundError: _handle_import_error,
+}
+
+
 def custom_exception_handler(
     exc: Exception, context: dict[str, Any]
 ) -> Response | None:
-    response = exception_handler(exc, context)
+    fast_handler = _FAST_HANDLERS.get(type(exc))
+    if fast_handler is not None:
+        return fast_handler(exc)
 
-    if isinstance(exc, ValueError):
-        return Response(
-            {
-                "error": "invalid_parameters",
-                "message": "Invalid query parameters",
-                "details": {"parameter_error": str(exc)},
-            },
-            status=status.HTTP_400_BAD_REQUEST,
-        )
-
-    if isinstance(exc, ImportError):
-        return Response(
-            {
-                "error": "dependency_error",
-                "message": "A required dependency is not installed",
-                "details": {"missing_dependency": str(exc)},
-            },
-            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        )
+    response = exception_handler(exc, context)
 
     if response is None:
+        # Subclasses missed by the exact-type dispatch still get their
+        # original status codes here.
+        if isinstance(exc, ValueError):
+            return _handle_value_error(exc)
+        if isinstance(exc, ImportError):
+            return _handle_import_error(exc)
+
         logger.error(f"Unhandled exception: {exc}", exc_info=True)
         return Response(
             {
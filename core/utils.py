@@ -1,10 +1,30 @@
+import re
+import secrets
+import time
+import uuid
 from urllib.parse import urlparse
 
 import requests
+from background_task import background
+from requests.adapters import HTTPAdapter, Retry
 from rest_framework import serializers
 
 from core.config import application_config
 
+# Shared session so repeated Mailgun calls reuse pooled TLS connections
+# instead of paying a fresh handshake per email.
+_mailgun_session = requests.Session()
+_mailgun_session.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(
+            total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504]
+        ),
+    ),
+)
+
 
 def send_email(
     emails: list[str], subject: str, content: str, fail_silently: bool = True
@@ -12,7 +32,7 @@ def send_email(
     api_key: str = application_config.MAILGUN_API_KEY or ""
     domain: str = application_config.MAILGUN_DOMAIN or ""
 
-    url = "https://api.mailgun.net/v3/" + domain + "/messages"
+    url = f"https://api.mailgun.net/v3/{domain}/messages"
     data = {
         "from": f"no.reply@{domain}",
         "to": emails,
@@ -20,23 +40,66 @@ def send_email(
         "html": content,
     }
 
-    response = requests.post(url, data=data, auth=("api", api_key))
+    response = _mailgun_session.post(url, data=data, auth=("api", api_key), timeout=10)
     if not fail_silently:
         response.raise_for_status()
 
     return response.ok
 
 
+@background(schedule=0)
+def send_email_task(emails: list[str], subject: str, content: str) -> None:
+    """Queue an email so callers don't block on the Mailgun round-trip."""
+    send_email(emails=emails, subject=subject, content=content)
+
+
+def uuid7() -> uuid.UUID:
+    """Generate a time-ordered UUIDv7 (RFC 9562).
+
+    Random v4 PKs cause B-tree page splits on every insert; v7 keeps new
+    rows clustered at the right edge of the index and makes ORDER BY id
+    approximate insertion order.
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    value = (timestamp_ms & ((1 << 48) - 1)) << 80
+    value |= 0x7 << 76  # version
+    value |= secrets.randbits(12) << 64
+    value |= 0x2 << 62  # variant
+    value |= secrets.randbits(62)
+    return uuid.UUID(int=value)
+
+
 class EmptySerializer(serializers.Serializer):
     pass
 
 
+# Fast path for extract_base_url: we only need scheme/host/port, so a
+# compiled regex beats urlparse's full pure-Python state machine.
+_BASE_URL_RE = re.compile(r"^([a-z][a-z0-9+.\-]*)://([^/:?#]+)(?::(\d+))?", re.I)
+
+
 def extract_base_url(url: str) -> str | None:
-    try:
-        parsed = urlparse(url)
-        if not parsed.scheme or not parsed.hostname:
+    if "[" in url or "@" in url:
+        # IPv6 literals and userinfo need the full parser
+        try:
+            parsed = urlparse(url)
+            if not parsed.scheme or not parsed.hostname:
+                return None
+            netloc = (
+                f"{parsed.hostname}:{parsed.port}" if parsed.port else parsed.hostname
+            )
+            return f"{parsed.scheme}://{netloc}"
+        except Exception:
             return None
-        netloc = f"{parsed.hostname}:{parsed.port}" if parsed.port else parsed.hostname
-        return f"{parsed.scheme}://{netloc}"
-    except Exception:
+
+    match = _BASE_URL_RE.match(url)
+    if not match:
         return None
+    scheme, host, port = match[1].lower(), match[2].lower(), match[3]
+    if port:
+        # urlparse rejects out-of-range ports; keep parity with the
+        # fallback branch above.
+        if int(port) > 65535:
+            return None
+        return f"{scheme}://{host}:{port}"
+    return f"{scheme}://{host}"
@@ -5,6 +5,15 @@ from django.utils.html import format_html
 
 from datasets.models import Dataset, DatasetFile, DatasetVersion, Tag
 
+# approval_status only ever renders one of two static snippets; escape them
+# once at import instead of per row.
+_APPROVED_HTML = format_html(
+    '<span style="color: green; font-weight: bold;">✓ Approved</span>'
+)
+_PENDING_HTML = format_html(
+    '<span style="color: orange; font-weight: bold;">⏳ Pending</span>'
+)
+
 
 @admin.register(Dataset)
 class DatasetAdmin(admin.ModelAdmin):  # type: ignore[type-arg]
@@ -19,18 +28,14 @@ class DatasetAdmin(admin.ModelAdmin):  # type: ignore[type-arg]
         "created_at",
     ]
     list_filter = ["is_approved", "status", "is_public", "created_at"]
+    # list_display renders owner per row; join it in instead of N+1 queries
+    list_select_related = ["owner", "approved_by"]
     search_fields = ["title", "description", "owner__email"]
     readonly_fields = ["id", "views", "downloads", "created_at", "updated_at"]
     actions = ["approve_datasets", "reject_datasets"]
 
     def approval_status(self, obj: Dataset) -> str:
-        if obj.is_approved:
-            return format_html(
-                '<span style="color: green; font-weight: bold;">✓ Approved</span>'
-            )
-        return format_html(
-            '<span style="color: orange; font-weight: bold;">⏳ Pending</span>'
-        )
+        return _APPROVED_HTML if obj.is_approved else _PENDING_HTML
 
     approval_status.short_description = "Approval Status"  # type: ignore[attr-defined]
 
@@ -0,0 +1,50 @@
+# Generated by Django 5.2.17 on 2026-08-31 19:32
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("datasets", "0001_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="dataset",
+            name="is_approved",
+            field=models.BooleanField(db_index=True, default=False),
+        ),
+        migrations.AlterField(
+            model_name="dataset",
+            name="is_public",
+            field=models.BooleanField(db_index=True, default=True),
+        ),
+        migrations.AlterField(
+            model_name="dataset",
+            name="status",
+            field=models.CharField(
+                choices=[
+                    ("draft", "draft"),
+                    ("published", "published"),
+                    ("archived", "archived"),
+                ],
+                db_index=True,
+                default="draft",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="dataset",
+            index=models.Index(
+                fields=["is_approved", "created_at"],
+                name="datasets_da_is_appr_7f8475_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="dataset",
+            index=models.Index(
+                fields=["owner", "-created_at"], name="datasets_da_owner_i_8bc803_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,58 @@
+# Generated by Django 5.2.17 on 2026-08-31 19:33
+
+from django.db import migrations, models
+
+import core.utils
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("datasets", "0002_alter_dataset_is_approved_alter_dataset_is_public_and_more"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="dataset",
+            name="id",
+            field=models.UUIDField(
+                default=core.utils.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+                unique=True,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="datasetfile",
+            name="id",
+            field=models.UUIDField(
+                default=core.utils.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+                unique=True,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="datasetversion",
+            name="id",
+            field=models.UUIDField(
+                default=core.utils.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+                unique=True,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="tag",
+            name="id",
+            field=models.UUIDField(
+                default=core.utils.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+                unique=True,
+            ),
+        ),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 5.2.17 on 2026-08-31 19:34
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.backends.base.schema import BaseDatabaseSchemaEditor
+from django.db.migrations.state import StateApps
+from django.db.models import Count
+
+
+def dedupe_checksums(apps: StateApps, schema_editor: BaseDatabaseSchemaEditor) -> None:
+    """Remove duplicate (dataset_version, checksum) rows before the
+    unique constraint lands, keeping the oldest file of each group so
+    migrate can't abort on legacy data."""
+    DatasetFile = apps.get_model("datasets", "DatasetFile")
+    duplicated = (
+        DatasetFile.objects.values("dataset_version", "checksum")
+        .annotate(copies=Count("id"))
+        .filter(copies__gt=1)
+    )
+    for group in duplicated.iterator():
+        duplicate_ids = list(
+            DatasetFile.objects.filter(
+                dataset_version=group["dataset_version"], checksum=group["checksum"]
+            )
+            .order_by("created_at", "id")
+            .values_list("id", flat=True)[1:]
+        )
+        DatasetFile.objects.filter(id__in=duplicate_ids).delete()
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("datasets", "0003_alter_dataset_id_alter_datasetfile_id_and_more"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="datasetfile",
+            name="checksum",
+            field=models.CharField(db_index=True, max_length=64),
+        ),
+        migrations.RunPython(dedupe_checksums, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="datasetfile",
+            constraint=models.UniqueConstraint(
+                fields=("dataset_version", "checksum"),
+                name="unique_checksum_per_version",
+            ),
+        ),
+    ]
@@ -0,0 +1,37 @@
+from django.db import migrations
+from django.db.backends.base.schema import BaseDatabaseSchemaEditor
+from django.db.migrations.state import StateApps
+
+# Expression matches what Django compiles SearchVector("title", "description",
+# config="english") to, so the search view's filter can use this index.
+CREATE_INDEX = """
+CREATE INDEX IF NOT EXISTS dataset_fts ON datasets_dataset USING GIN (
+    to_tsvector('english', COALESCE(title, '') || ' ' || COALESCE(description, ''))
+);
+"""
+
+DROP_INDEX = "DROP INDEX IF EXISTS dataset_fts;"
+
+
+def create_fts_index(apps: StateApps, schema_editor: BaseDatabaseSchemaEditor) -> None:
+    # GIN/tsvector are Postgres-only; the sqlite dev fallback keeps using
+    # icontains in the view and needs no index here.
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(CREATE_INDEX)
+
+
+def drop_fts_index(apps: StateApps, schema_editor: BaseDatabaseSchemaEditor) -> None:
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(DROP_INDEX)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("datasets", "0004_alter_datasetfile_checksum_and_more"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_fts_index, drop_fts_index),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.17 on 2026-08-31 19:55
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("datasets", "0005_dataset_fts_index"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="dataset",
+            index=models.Index(
+                fields=["is_public", "-created_at"],
+                name="datasets_da_is_publ_556d4f_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="dataset",
+            index=models.Index(
+                fields=["is_public", "-completeness_score"],
+                name="datasets_da_is_publ_0ca9b4_idx",
+            ),
+        ),
+    ]
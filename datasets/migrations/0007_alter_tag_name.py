@@ -0,0 +1,17 @@
+# Generated by Django 5.2.17 on 2026-08-31 19:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("datasets", "0006_dataset_datasets_da_is_publ_556d4f_idx_and_more"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="tag",
+            name="name",
+            field=models.CharField(max_length=25, unique=True),
+        ),
+    ]
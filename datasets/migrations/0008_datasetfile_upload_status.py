@@ -0,0 +1,19 @@
+# Generated by Django 5.2.17 on 2026-08-31 19:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("datasets", "0007_alter_tag_name"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="datasetfile",
+            name="upload_status",
+            field=models.CharField(
+                choices=[("pending", "pending"), ("ready", "ready")], default="ready"
+            ),
+        ),
+    ]
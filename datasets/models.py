@@ -1,12 +1,10 @@
-import uuid
-
 from django.db import models
 
+from core.utils import uuid7
+
 
 class Dataset(models.Model):
-    id = models.UUIDField(
-        primary_key=True, default=uuid.uuid4, unique=True, editable=False
-    )
+    id = models.UUIDField(primary_key=True, default=uuid7, unique=True, editable=False)
     title = models.CharField(null=False, max_length=100)
     description = models.TextField(null=False, blank=False)
     license = models.CharField(blank=True, max_length=30, default="")
@@ -30,12 +28,13 @@ class Dataset(models.Model):
             ("archived", "archived"),
         ],
         default="draft",
+        db_index=True,
     )
-    is_approved = models.BooleanField(default=False)
+    is_approved = models.BooleanField(default=False, db_index=True)
     approved_by = models.ForeignKey(
         "users.User", on_delete=models.DO_NOTHING, related_name="approvals", null=True
     )
-    is_public = models.BooleanField(default=True)
+    is_public = models.BooleanField(default=True, db_index=True)
     metadata = models.JSONField(default=dict)
     views = models.BigIntegerField(default=0)
     downloads = models.BigIntegerField(default=0)
@@ -48,14 +47,23 @@ class Dataset(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            # Moderator listing: pending datasets ordered by recency
+            models.Index(fields=["is_approved", "created_at"]),
+            # Per-owner dataset listings
+            models.Index(fields=["owner", "-created_at"]),
+            # Public search sorted by the default/common sort keys
+            models.Index(fields=["is_public", "-created_at"]),
+            models.Index(fields=["is_public", "-completeness_score"]),
+        ]
+
     def __str__(self) -> str:
         return self.title
 
 
 class DatasetVersion(models.Model):
-    id = models.UUIDField(
-        primary_key=True, default=uuid.uuid4, unique=True, editable=False
-    )
+    id = models.UUIDField(primary_key=True, default=uuid7, unique=True, editable=False)
     dataset = models.ForeignKey(
         "datasets.Dataset", on_delete=models.CASCADE, related_name="versions"
     )
@@ -77,9 +85,7 @@ class DatasetVersion(models.Model):
 
 
 class DatasetFile(models.Model):
-    id = models.UUIDField(
-        primary_key=True, default=uuid.uuid4, unique=True, editable=False
-    )
+    id = models.UUIDField(primary_key=True, default=uuid7, unique=True, editable=False)
     dataset_version = models.ForeignKey(
         "datasets.DatasetVersion", on_delete=models.CASCADE, related_name="files"
     )
@@ -97,7 +103,17 @@ class DatasetFile(models.Model):
         ]
     )
     file_size_bytes = models.BigIntegerField()
-    checksum = models.TextField()
+    # "pending" while the background worker is still pushing the staged
+    # upload to GCS and extracting metadata
+    upload_status = models.CharField(
+        choices=[
+            ("pending", "pending"),
+            ("ready", "ready"),
+        ],
+        default="ready",
+    )
+    # Hex digest (64 chars covers SHA-256); indexed for dedupe lookups
+    checksum = models.CharField(max_length=64, db_index=True)
     owner = models.ForeignKey(
         "users.User", on_delete=models.CASCADE, related_name="files"
     )
@@ -107,15 +123,26 @@ class DatasetFile(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        constraints = [
+            # A version cannot contain the same file content twice. The
+            # backing unique index also serves any (dataset_version,
+            # checksum) dedup lookup, so no separate index is needed for
+            # those.
+            models.UniqueConstraint(
+                fields=["dataset_version", "checksum"],
+                name="unique_checksum_per_version",
+            ),
+        ]
+
     def __str__(self) -> str:
         return self.upload_id
 
 
 class Tag(models.Model):
-    id = models.UUIDField(
-        primary_key=True, default=uuid.uuid4, unique=True, editable=False
-    )
-    name = models.CharField(max_length=25)
+    id = models.UUIDField(primary_key=True, default=uuid7, unique=True, editable=False)
+    # Unique so concurrent tag creation can rely on INSERT ... ON CONFLICT
+    name = models.CharField(max_length=25, unique=True)
 
     def __str__(self) -> str:
         return self.name
@@ -6,6 +6,15 @@ from django.utils.html import format_html
 
 from datasets.models import Dataset
 
+# approval_status only ever renders one of two static snippets; escape them
+# once at import instead of per row.
+_APPROVED_HTML = format_html(
+    '<span style="color: green; font-weight: bold;">✓ Approved</span>'
+)
+_PENDING_HTML = format_html(
+    '<span style="color: orange; font-weight: bold;">⏳ Pending</span>'
+)
+
 
 class ModeratorAdminSite(AdminSite):
     site_header = "Moderator Dashboard"
@@ -14,11 +23,18 @@ class ModeratorAdminSite(AdminSite):
 
     def has_permission(self, request: HttpRequest) -> bool:
         """Allow moderators only"""
-        return (
+        # Memoized per request: this runs for every ModelAdmin/menu item on a
+        # page render and the role check touches the lazily-loaded user.
+        cached: bool | None = getattr(request, "_moderator_admin_perm", None)
+        if cached is not None:
+            return cached
+        allowed = (
             request.user.is_active
             and request.user.is_staff
             and request.user.role == "moderator"
         )
+        request._moderator_admin_perm = allowed  # type: ignore[attr-defined]
+        return allowed
 
 
 # Create the moderator admin site instance
@@ -38,6 +54,8 @@ class ModeratorDatasetAdmin(admin.ModelAdmin):  # type: ignore[type-arg]
         "created_at",
     ]
     list_filter = ["is_approved", "status", "is_public", "created_at"]
+    # list_display renders owner per row; join it in instead of N+1 queries
+    list_select_related = ["owner", "approved_by"]
     search_fields = ["title", "description", "owner__email"]
     readonly_fields = [
         "id",
@@ -62,13 +80,7 @@ class ModeratorDatasetAdmin(admin.ModelAdmin):  # type: ignore[type-arg]
     actions = ["approve_datasets", "reject_datasets"]
 
     def approval_status(self, obj: Dataset) -> str:
-        if obj.is_approved:
-            return format_html(
-                '<span style="color: green; font-weight: bold;">✓ Approved</span>'
-            )
-        return format_html(
-            '<span style="color: orange; font-weight: bold;">⏳ Pending</span>'
-        )
+        return _APPROVED_HTML if obj.is_approved else _PENDING_HTML
 
     approval_status.short_description = "Approval Status"  # type: ignore[attr-defined]
 
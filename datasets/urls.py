@@ -1,4 +1,4 @@
-from django.urls import path
+from django.urls import include, path
 
 from datasets.views import (
     DeleteDatasetFileView,
@@ -13,35 +13,54 @@ from datasets.views import (
     UploadDatasetView,
 )
 
+# Patterns sharing a prefix are grouped under include() so the resolver
+# matches the prefix once instead of re-testing it for every sibling route.
 urlpatterns = [
     path("", UploadDatasetView.as_view(), name="upload_dataset"),
     path("tags/", ListTagsView.as_view(), name="list_tags"),
     path("internal/search/", InternalDatasetSearchView.as_view(), name="list_datasets"),
-    path("<str:id>/update/", UpdateDatasetView.as_view(), name="update_dataset"),
-    path("<str:id>/view/", RetrieveDatasetView.as_view(), name="retrieve_dataset"),
     path(
-        "<str:id>/versions/update/",
-        UpdateDatasetVersion.as_view(),
-        name="update_dataset_version",
+        "versions/<str:id>/",
+        include(
+            [
+                path(
+                    "delete/",
+                    DeleteDatasetVersionView.as_view(),
+                    name="delete_dataset_version",
+                ),
+            ]
+        ),
     ),
     path(
-        "<str:id>/delete/",
-        DeleteDatasetView.as_view(),
-        name="delete_dataset",
+        "files/<str:id>/",
+        include(
+            [
+                path(
+                    "delete/",
+                    DeleteDatasetFileView.as_view(),
+                    name="delete_dataset_file",
+                ),
+                path(
+                    "download/",
+                    DownloadDatasetFileView.as_view(),
+                    name="download_dataset_file",
+                ),
+            ]
+        ),
     ),
     path(
-        "versions/<str:id>/delete/",
-        DeleteDatasetVersionView.as_view(),
-        name="delete_dataset_version",
-    ),
-    path(
-        "files/<str:id>/delete/",
-        DeleteDatasetFileView.as_view(),
-        name="delete_dataset_file",
-    ),
-    path(
-        "files/<str:id>/download/",
-        DownloadDatasetFileView.as_view(),
-        name="download_dataset_file",
+        "<str:id>/",
+        include(
+            [
+                path("update/", UpdateDatasetView.as_view(), name="update_dataset"),
+                path("view/", RetrieveDatasetView.as_view(), name="retrieve_dataset"),
+                path(
+                    "versions/update/",
+                    UpdateDatasetVersion.as_view(),
+                    name="update_dataset_version",
+                ),
+                path("delete/", DeleteDatasetView.as_view(), name="delete_dataset"),
+            ]
+        ),
     ),
 ]
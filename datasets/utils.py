@@ -1,17 +1,18 @@
 import csv
+import hashlib
 import logging
 import os
+import tempfile
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Any, TypedDict
 from uuid import UUID
 
 import google.cloud.storage as storage
-import pandas as pd
 from background_task import background
 from charset_normalizer import from_bytes
-from django.core.files.uploadedfile import InMemoryUploadedFile
+from django.core.files.base import File
 from google.oauth2 import service_account
-from pandas.api.types import infer_dtype, is_numeric_dtype
 
 from core.config import application_config
 from datasets.models import Dataset, DatasetFile, DatasetVersion
@@ -27,20 +28,116 @@ class FileMetadata(TypedDict):
     # statistical_summary: dict
 
 
-def upload_datasetfile_to_gcloud(file: InMemoryUploadedFile) -> storage.Blob:
+# Beyond this size a full parse would hold multi-GB frames in the worker;
+# metadata is inferred from a prefix of rows instead.
+METADATA_BUDGET_BYTES = 20 * 1024 * 1024
+METADATA_MAX_ROWS = 200_000
+
+
+@lru_cache(maxsize=1)
+def _gcs_bucket() -> storage.Bucket:
+    """Build the GCS client and bucket once per process.
+
+    Reconstructing credentials + client per call re-parses key material and
+    sets up a fresh OAuth/HTTP session (~50-200ms each time).
+    """
     cred = service_account.Credentials.from_service_account_info(
         application_config.GOOGLE_SERVICE_ACCOUNT_INFO
     )
-    storage_client = storage.Client(credentials=cred)
-    bucket = storage_client.bucket(application_config.BUCKET_NAME)
+    return storage.Client(credentials=cred).bucket(application_config.BUCKET_NAME)
+
+
+def compute_checksum(file: File) -> str:
+    """Stream a SHA-256 over the file in fixed-size chunks.
+
+    file_digest reads through OpenSSL's buffered update loop, so peak
+    memory stays O(chunk) instead of the old read()-everything-then-hash
+    approach, and the hot loop runs on OpenSSL's SIMD sha256 path.
+    """
+    file.seek(0)
+    return hashlib.file_digest(file, "sha256").hexdigest()
+
+
+def upload_datasetfile_to_gcloud(file: File) -> storage.Blob:
+    bucket = _gcs_bucket()
 
     blob = bucket.blob(file.name)
-    blob.upload_from_file(file_obj=file)
-    file_info = bucket.get_blob(blob_name=blob.name)
-    return file_info
+    # 8MB chunks switch large files to resumable uploads instead of one
+    # monolithic request.
+    blob.chunk_size = 8 * 1024 * 1024
+    blob.upload_from_file(file_obj=file, size=file.size)
+    # upload_from_file populates the blob's properties (size, md5, public
+    # url) from the upload response, so the old get_blob round-trip only
+    # repeated a GET for data we already hold.
+    return blob
+
+
+def _parquet_footer_metadata(file: File) -> dict[str, Any] | None:
+    """Build metadata from the parquet footer without decoding column data.
+
+    Parquet already stores row counts, the schema and per-column null counts
+    in its footer, so stats that would otherwise need a full decompress/scan
+    are available in O(KB). Returns None when the footer lacks statistics,
+    in which case the caller falls back to the full read.
+    """
+    from pyarrow import parquet
 
+    try:
+        parquet_file = parquet.ParquetFile(file)
+        footer = parquet_file.metadata
+        arrow_schema = parquet_file.schema_arrow
+
+        null_counts = [0] * footer.num_columns
+        for group_index in range(footer.num_row_groups):
+            row_group = footer.row_group(group_index)
+            for column_index in range(footer.num_columns):
+                statistics = row_group.column(column_index).statistics
+                if statistics is None or not statistics.has_null_count:
+                    return None
+                null_counts[column_index] += statistics.null_count
+
+        column_schema: list[dict[str, Any]] = [
+            {
+                "name": arrow_schema.field(column_index).name,
+                "type": str(arrow_schema.field(column_index).type),
+                "frequent_occurences": [],
+                "missing_or_null_count": null_counts[column_index],
+                "unique_element_count": None,
+                "mean": None,
+                "median": None,
+                "mode": [],
+            }
+            for column_index in range(footer.num_columns)
+        ]
+
+        return {
+            "extraction_timestamp": datetime.now().isoformat(),
+            "file_info": {
+                "csv_delimiter": None,
+                "file_size": file.size,
+                "encoding": None,
+            },
+            "structure": {
+                "rows": footer.num_rows,
+                "columns": footer.num_columns,
+                "column_names": arrow_schema.names,
+                "shape": (footer.num_rows, footer.num_columns),
+            },
+            "statistical_summary": {},
+            "column_schema": column_schema,
+        }
+    except Exception:
+        return None
+    finally:
+        file.seek(0)
+
+
+def compute_metadata(file: File) -> dict[str, Any] | None:
+    # pandas costs ~300ms and ~80MB at import; keep it off the Django boot
+    # path and only pay for it when metadata is actually computed.
+    import pandas as pd
+    from pandas.api.types import infer_dtype, is_numeric_dtype
 
-def compute_metadata(file: InMemoryUploadedFile) -> dict[str, Any] | None:
     delimiter = None
     df: pd.DataFrame | None = None
     file.seek(0)
@@ -52,14 +149,67 @@ def compute_metadata(file: InMemoryUploadedFile) -> dict[str, Any] | None:
 
     ext = ext.replace(".", "")
 
+    if ext == "parquet":
+        footer_metadata = _parquet_footer_metadata(file)
+        if footer_metadata is not None:
+            return footer_metadata
+
+    # Hard memory budget: a 200MB CSV expands to multiple GB as a frame, so
+    # above the budget only a prefix of rows is parsed for schema/stats.
+    # Parquet is unaffected (footer path above reads exact counts either way).
+    capped = bool(file.size and file.size > METADATA_BUDGET_BYTES)
+
     if ext == "csv":
-        df = pd.read_csv(file)
+        if capped:
+            # Stream record batches with Arrow's vectorized reader and stop
+            # at the row cap, instead of pandas' single-threaded C engine.
+            try:
+                from pyarrow import Table
+                from pyarrow import csv as pyarrow_csv
+
+                reader = pyarrow_csv.open_csv(
+                    file,
+                    read_options=pyarrow_csv.ReadOptions(block_size=1 << 20),
+                )
+                batches = []
+                batch_rows = 0
+                for batch in reader:
+                    batches.append(batch)
+                    batch_rows += batch.num_rows
+                    if batch_rows >= METADATA_MAX_ROWS:
+                        break
+                df = Table.from_batches(batches).to_pandas()
+                df = df.iloc[:METADATA_MAX_ROWS]
+            except Exception:
+                file.seek(0)
+                df = pd.read_csv(file, nrows=METADATA_MAX_ROWS)
+        else:
+            # The pyarrow engine parses with a multi-threaded C++ reader
+            # instead of pandas' single-threaded tokenizer; several times
+            # faster on the large uploads this handles.
+            df = pd.read_csv(file, engine="pyarrow")
 
     if ext == "xlsx":
-        df = pd.read_excel(file)
+        df = pd.read_excel(file, nrows=METADATA_MAX_ROWS if capped else None)
 
     if ext == "json":
-        df = pd.read_json(file)
+        # Files starting with "{" are (or at least look like) newline-
+        # delimited objects, which Arrow's multithreaded streaming
+        # reader parses several times faster than pd.read_json. Arrow
+        # can't read a top-level array, so those stay on pandas.
+        head = file.read(64).lstrip()
+        file.seek(0)
+        df = None
+        if head.startswith(b"{"):
+            try:
+                from pyarrow import json as pyarrow_json
+
+                df = pyarrow_json.read_json(file).to_pandas()
+            except Exception:
+                file.seek(0)
+                df = None
+        if df is None:
+            df = pd.read_json(file)
 
     if ext == "parquet":
         df = pd.read_parquet(file)
@@ -68,18 +218,32 @@ def compute_metadata(file: InMemoryUploadedFile) -> dict[str, Any] | None:
         return None
 
     try:
-        file.seek(0)
-        charset_match = from_bytes(file.read())
         file_encoding: str | None = None
-        if charset_match:
-            best_file_encoding = charset_match.best()
-            if best_file_encoding:
-                file_encoding = best_file_encoding.encoding
+        sample_bytes = b""
+        if ext in ("csv", "json"):
+            # A 64KB sample is plenty for a confident encoding guess;
+            # detection over the whole upload is O(N) pure Python. Binary
+            # formats (xlsx/parquet) have no text encoding to detect.
+            # Nearly all uploads are ASCII/UTF-8, which the C decoder
+            # verifies for free; charset_normalizer's pure-Python scan only
+            # runs for the rare non-UTF-8 file.
+            file.seek(0)
+            sample_bytes = file.read(65536)
+            try:
+                sample_bytes.decode("utf-8")
+                file_encoding = "ascii" if sample_bytes.isascii() else "utf_8"
+            except UnicodeDecodeError:
+                charset_match = from_bytes(sample_bytes)
+                if charset_match:
+                    best_file_encoding = charset_match.best()
+                    if best_file_encoding:
+                        file_encoding = best_file_encoding.encoding
 
         if ext == "csv":
-            file.seek(0)
-            sample = file.read(4096)
-            dialect = csv.Sniffer().sniff(sample.decode(file_encoding))
+            sample = sample_bytes[:4096]
+            dialect = csv.Sniffer().sniff(
+                sample.decode(file_encoding or "latin-1", errors="replace")
+            )
             delimiter = dialect.delimiter
 
         metadata: dict[str, Any] = {
@@ -100,47 +264,95 @@ def compute_metadata(file: InMemoryUploadedFile) -> dict[str, Any] | None:
             "shape": df.shape,
         }
 
+        # Frequency/mode/uniqueness stats only feed the UI's top-3 display,
+        # so beyond 1M rows a uniform 100k sample is statistically plenty
+        # and cuts the O(N log N) counting cost to O(sample). Null counts
+        # and mean/median stay exact: they're cheap linear passes.
+        sampled = len(df) > 1_000_000
+        stats_df = df.sample(n=100_000, random_state=0) if sampled else df
+        if sampled:
+            metadata["sampled"] = True
+        if capped and ext in ("csv", "xlsx"):
+            # Row/stat figures describe the parsed prefix, not the full file.
+            metadata["sampled_from_prefix_rows"] = len(df)
+
+        # Compute mean/median for every numeric column in one frame-level
+        # call each: pandas reduces all columns in its C internals, instead
+        # of a Python-level mean()/median() dispatch per column. On wide
+        # tables the per-column call overhead dominates the arithmetic.
+        numeric_means = numeric_medians = None
+        try:
+            numeric_df = df.select_dtypes("number")
+            if len(numeric_df.columns):
+                numeric_means = numeric_df.mean()
+                numeric_medians = numeric_df.median()
+        except Exception:
+            numeric_means = numeric_medians = None
+
         column_schema: list[dict[str, Any]] = []
         for col in df.columns:
             col_data = df[col]
+            sample_data = stats_df[col]
             original_dtype = infer_dtype(col_data)
 
-            # Get top 3 most frequent values
-            most_frequent = col_data.value_counts(normalize=True).head(3) * 100
+            # One counting pass: top-3 frequencies, mode, null count all come
+            # from the same value_counts result instead of separate column
+            # traversals for value_counts, mode and isna.
+            counts = sample_data.value_counts()
+            non_null_count = int(counts.sum())
+            if sampled:
+                # The fused null count only holds when counting the full
+                # column; keep it exact with a linear isna pass.
+                null_count = int(col_data.isna().sum())
+            else:
+                null_count = len(col_data) - non_null_count
+
+            if non_null_count:
+                most_frequent = counts.head(3) / non_null_count * 100
+            else:
+                most_frequent = counts.head(3).astype(float)
             top3_list = [
                 {"value": str(index), "frequency_percent": round(freq, 2)}
                 for index, freq in most_frequent.items()
             ]
 
+            if len(counts):
+                max_count = counts.iloc[0]
+                mode_list = [
+                    str(val) for val in counts.index[counts == max_count][:3].tolist()
+                ]
+            else:
+                mode_list = []
+
+            # nunique hashes the typed array in C; the old astype(str) pass
+            # built a Python string per cell just to make mixed columns
+            # hashable. Genuinely mixed columns go through pd.unique on the
+            # raw object array instead, which still avoids the string cast.
+            if original_dtype.startswith("mixed"):
+                unique_count = int(pd.unique(sample_data.to_numpy()).size)
+            else:
+                unique_count = int(sample_data.nunique(dropna=False))
+
             # Handle numeric statistics
             mean_val = None
             median_val = None
-            if is_numeric_dtype(col_data):
-                try:
-                    mean_val = (
-                        float(col_data.mean()) if not pd.isna(col_data.mean()) else None
-                    )
-                    median_val = (
-                        float(col_data.median())
-                        if not pd.isna(col_data.median())
-                        else None
-                    )
-                except Exception:
-                    mean_val = None
-                    median_val = None
-
-            # Handle mode (convert to serializable format)
-            mode_values = col_data.mode()
-            mode_list = [
-                str(val) for val in mode_values.tolist()[:3]
-            ]  # Limit to first 3 modes
+            if (
+                numeric_means is not None
+                and numeric_medians is not None
+                and is_numeric_dtype(col_data)
+                and col in numeric_means.index
+            ):
+                mean = numeric_means[col]
+                median = numeric_medians[col]
+                mean_val = float(mean) if not pd.isna(mean) else None
+                median_val = float(median) if not pd.isna(median) else None
 
             schema: dict[str, Any] = {
                 "name": col,
                 "type": original_dtype,
                 "frequent_occurences": top3_list,
-                "missing_or_null_count": int(col_data.isna().sum()),
-                "unique_element_count": int(col_data.astype(str).nunique()),
+                "missing_or_null_count": null_count,
+                "unique_element_count": unique_count,
                 "mean": mean_val,
                 "median": median_val,
                 "mode": mode_list,
@@ -158,6 +370,86 @@ def compute_metadata(file: InMemoryUploadedFile) -> dict[str, Any] | None:
     return metadata
 
 
+@background(schedule=0)
+def process_upload_task(file_id: str | UUID, temp_path: str) -> None:
+    """Push a staged upload to GCS and fill in its metadata.
+
+    The HTTP worker only writes the upload to a temp file and records a
+    pending DatasetFile; the GCS transfer and the pandas metadata pass both
+    run here, so upload response latency no longer scales with file size.
+    """
+    try:
+        dataset_file = DatasetFile.objects.get(id=file_id)
+    except DatasetFile.DoesNotExist:
+        logger.warning("File not found")
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        return
+
+    try:
+        with open(temp_path, "rb") as temp_file:
+            file = File(temp_file, name=dataset_file.upload_id)
+            blob = upload_datasetfile_to_gcloud(file)
+            file.seek(0)
+            metadata = compute_metadata(file) or {}
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+    dataset_file.upload_url = blob.public_url or ""
+    dataset_file.metadata = {
+        "file_info": metadata.get("file_info"),
+        "structure": metadata.get("structure"),
+        "extraction_timestamp": metadata.get("extraction_timestamp"),
+        "failure_reason": metadata.get("failure_reason"),
+        "meta_generation_failure": metadata.get("meta_generation_failure", False),
+        "meta_generation_failure_timestamp": metadata.get(
+            "meta_generation_failure_timestamp"
+        ),
+    }
+    dataset_file.column_schema = metadata.get("column_schema", [])
+    dataset_file.upload_status = "ready"
+    dataset_file.save(
+        update_fields=["upload_url", "metadata", "column_schema", "upload_status"]
+    )
+    logger.info(f"DatasetFile {file_id} uploaded and processed.")
+
+
+@background(schedule=0)
+def compute_metadata_task(file_id: str | UUID) -> None:
+    """Extract file metadata in the background worker.
+
+    Metadata extraction parses the whole upload with pandas, which can block
+    a request worker for seconds on large files. The upload response returns
+    with empty metadata and this task fills it in afterwards from the blob
+    already sitting in GCS.
+    """
+    try:
+        dataset_file = DatasetFile.objects.get(id=file_id)
+    except DatasetFile.DoesNotExist:
+        logger.warning("File not found")
+        return
+
+    blob = _gcs_bucket().blob(dataset_file.upload_id)
+    with tempfile.TemporaryFile() as tmp:
+        blob.download_to_file(tmp)
+        tmp.seek(0)
+        metadata = compute_metadata(File(tmp, name=dataset_file.upload_id)) or {}
+
+    dataset_file.metadata = {
+        "file_info": metadata.get("file_info"),
+        "structure": metadata.get("structure"),
+        "extraction_timestamp": metadata.get("extraction_timestamp"),
+        "failure_reason": metadata.get("failure_reason"),
+        "meta_generation_failure": metadata.get("meta_generation_failure", False),
+        "meta_generation_failure_timestamp": metadata.get(
+            "meta_generation_failure_timestamp"
+        ),
+    }
+    dataset_file.column_schema = metadata.get("column_schema", [])
+    dataset_file.save(update_fields=["metadata", "column_schema"])
+
+
 # Completeness score
 def compute_completeness(dataset: Dataset) -> int:
     score = 0
@@ -178,7 +470,9 @@ def compute_completeness(dataset: Dataset) -> int:
     if dataset.update_frequency and dataset.update_frequency.lower() != "never":
         score += 1
 
-    if dataset.tags.exists() and dataset.tags.count() >= 3:
+    # Single COUNT query; the previous exists() check was a redundant extra
+    # round-trip already implied by count() >= 3.
+    if dataset.tags.count() >= 3:
         score += 2
 
     metadata = dataset.metadata or {}
@@ -204,11 +498,7 @@ def compute_completeness(dataset: Dataset) -> int:
 
 def delete_blob(blob_name: str) -> bool:
     try:
-        cred = service_account.Credentials.from_service_account_info(
-            application_config.GOOGLE_SERVICE_ACCOUNT_INFO
-        )
-        storage_client = storage.Client(credentials=cred)
-        bucket = storage_client.bucket(application_config.BUCKET_NAME)
+        bucket = _gcs_bucket()
 
         blob = bucket.blob(blob_name)
         blob.delete()
@@ -218,16 +508,30 @@ def delete_blob(blob_name: str) -> bool:
         return False
 
 
+def delete_blobs(blob_names: list[str]) -> None:
+    """Delete blobs in batched requests (100 ops per round-trip) instead of
+    one HTTP request per blob."""
+    bucket = _gcs_bucket()
+    for batch_start in range(0, len(blob_names), 100):
+        try:
+            with bucket.client.batch(raise_exception=False):
+                for blob_name in blob_names[batch_start : batch_start + 100]:
+                    bucket.blob(blob_name).delete()
+        except Exception as e:
+            logger.error(f"Failed to batch-delete blobs: {e}")
+
+
 @background(schedule=0)
 def delete_dataset_task(dataset_id: str | UUID) -> None:
     try:
-        dataset = Dataset.objects.prefetch_related("files").get(id=dataset_id)
+        dataset = Dataset.objects.get(id=dataset_id)
     except Dataset.DoesNotExist:
         logger.warning("Dataset not found")
         return
 
-    for file in dataset.files.all():
-        delete_blob(file.upload_id)
+    # values_list skips building DatasetFile instances; the task only needs
+    # the blob names.
+    delete_blobs(list(dataset.files.values_list("upload_id", flat=True)))
 
     dataset.delete()
     logger.info(f"Dataset {dataset_id} deleted with all versions and files.")
@@ -236,13 +540,12 @@ def delete_dataset_task(dataset_id: str | UUID) -> None:
 @background(schedule=0)
 def delete_version_task(version_id: str | UUID) -> None:
     try:
-        version = DatasetVersion.objects.prefetch_related("files").get(id=version_id)
+        version = DatasetVersion.objects.get(id=version_id)
     except DatasetVersion.DoesNotExist:
         logger.warning("Version not found")
         return
 
-    for file in version.files.all():
-        delete_blob(file.upload_id)
+    delete_blobs(list(version.files.values_list("upload_id", flat=True)))
 
     version.delete()
     logger.info(f"DatasetVersion {version_id} deleted with all files.")
@@ -261,17 +564,29 @@ def delete_file_task(file_id: str | UUID) -> None:
     logger.info(f"DatasetFile {file_id} deleted.")
 
 
+@lru_cache(maxsize=1)
+def _warn_if_remote_signing() -> None:
+    """Log once if signed URLs can't be produced locally.
+
+    With a private_key in the service-account info, generate_signed_url
+    signs in-process; without one, every URL costs an IAM signBlob API
+    round-trip (~200ms), which multiplies across file listings.
+    """
+    if "private_key" not in application_config.GOOGLE_SERVICE_ACCOUNT_INFO:
+        logger.warning(
+            "Service account info has no private_key; presigned URLs will be "
+            "signed via the IAM signBlob API, adding a round-trip per URL."
+        )
+
+
 def generate_presigned_url(
     blob_id: str,
     expiration: timedelta = timedelta(hours=2),
     raise_exception: bool = True,
 ) -> str | None:
     try:
-        cred = service_account.Credentials.from_service_account_info(
-            application_config.GOOGLE_SERVICE_ACCOUNT_INFO
-        )
-        storage_client = storage.Client(credentials=cred)
-        bucket = storage_client.bucket(application_config.BUCKET_NAME)
+        _warn_if_remote_signing()
+        bucket = _gcs_bucket()
 
         blob = bucket.blob(blob_id.removeprefix(f"{bucket.name}/"))
         url: str = blob.generate_signed_url(expiration=expiration)
@@ -1,11 +1,12 @@
-import hashlib
 import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
-from typing import Any
+from typing import Any, cast
 
-from django.conf import settings
-from django.db import transaction
-from django.db.models import Q, QuerySet
+from django.contrib.postgres.search import SearchQuery, SearchVector
+from django.db import connection, transaction
+from django.db.models import Prefetch, Q, QuerySet
 from django.template.loader import render_to_string
 from rest_framework.exceptions import ValidationError
 from rest_framework.generics import (
@@ -22,7 +23,7 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from core.utils import EmptySerializer, send_email
+from core.utils import EmptySerializer, send_email_task
 from datasets.models import Dataset, DatasetFile, DatasetVersion, Tag
 from datasets.serializers import (
     CreateDatasetSerializer,
@@ -35,12 +36,14 @@ from datasets.serializers import (
     UpdateDatasetVersionSerializer,
 )
 from datasets.utils import (
+    compute_checksum,
     compute_completeness,
-    compute_metadata,
+    compute_metadata_task,
     delete_dataset_task,
     delete_file_task,
     delete_version_task,
     generate_presigned_url,
+    process_upload_task,
     upload_datasetfile_to_gcloud,
 )
 from users.models import User
@@ -49,6 +52,25 @@ from users.permissions import is_accessible
 PageNumberPagination.page_size = 20
 
 
+def with_serializer_relations(queryset: QuerySet[Dataset]) -> QuerySet[Dataset]:
+    """Prefetch everything DatasetSerializer touches.
+
+    The serializer nests versions -> files plus tags and owner; without
+    these, serializing K datasets costs O(K * versions) queries.
+    """
+    return queryset.select_related("owner").prefetch_related(
+        Prefetch(
+            "versions",
+            queryset=DatasetVersion.objects.prefetch_related(
+                # DatasetFileSerializer excludes upload_url, so skip hauling
+                # the (often longest) column through the prefetch at all.
+                Prefetch("files", queryset=DatasetFile.objects.defer("upload_url"))
+            ),
+        ),
+        "tags",
+    )
+
+
 class UploadDatasetView(CreateAPIView):
     permission_classes = [is_accessible("admin", "member")]
     parser_classes = [MultiPartParser]
@@ -57,7 +79,7 @@ class UploadDatasetView(CreateAPIView):
     def create(self, request: Request) -> Response:
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
-        owner: User = User.objects.get(id=str(request.user.id))
+        owner = cast(User, request.user)
         is_approved = (
             True
             if owner.role == "admin"
@@ -71,6 +93,39 @@ class UploadDatasetView(CreateAPIView):
             else None
         )
 
+        files = request.FILES.getlist("files")
+        # hashlib releases the GIL on large buffers, so sibling files
+        # hash on separate cores; single-file uploads skip the pool.
+        if len(files) > 1:
+            with ThreadPoolExecutor(max_workers=min(8, len(files))) as executor:
+                checksums = list(executor.map(compute_checksum, files))
+        else:
+            checksums = [compute_checksum(file) for file in files]
+
+        # Hashing and temp staging touch no tables; doing them before the
+        # transaction keeps it to pure row writes instead of holding a DB
+        # connection open across file IO.
+        staged_files = []
+        temp_paths = []
+        seen_checksums: set[str] = set()
+        for file, checksum in zip(files, checksums, strict=True):
+            # The same content twice in one request would trip the
+            # unique_checksum_per_version constraint mid-transaction; keep
+            # the first copy, like the version-update path does.
+            if checksum in seen_checksums:
+                continue
+            seen_checksums.add(checksum)
+            _, ext = os.path.splitext(file.name)
+            ext = ext.replace(".", "")
+
+            file.seek(0)
+            fd, temp_path = tempfile.mkstemp(prefix="ng-dataset-upload-")
+            with os.fdopen(fd, "wb") as temp_file:
+                for chunk in file.chunks():
+                    temp_file.write(chunk)
+            temp_paths.append(temp_path)
+            staged_files.append((file, checksum, ext))
+
         try:
             with transaction.atomic():
                 dataset = Dataset.objects.create(
@@ -90,14 +145,20 @@ class UploadDatasetView(CreateAPIView):
                     approved_by=approved_by,
                 )
 
-                # Dataset tags added
-                tags_data = serializer.validated_data.get("tags", [])
-                tag_list = []
-                for tag_name in tags_data:
-                    tags, _ = Tag.objects.get_or_create(name=tag_name.strip().lower())
-                    tag_list.append(tags)
-
-                dataset.tags.set(tag_list)
+                # Dataset tags added: one conflict-ignoring INSERT plus one
+                # fetch instead of a get_or_create (2 queries) per tag.
+                tag_names = {
+                    tag_name.strip().lower()
+                    for tag_name in serializer.validated_data.get("tags", [])
+                }
+                tag_list: list[Tag] = []
+                if tag_names:
+                    Tag.objects.bulk_create(
+                        [Tag(name=name) for name in tag_names],
+                        ignore_conflicts=True,
+                    )
+                    tag_list = list(Tag.objects.filter(name__in=tag_names))
+                    dataset.tags.set(tag_list)
                 dataset_version = DatasetVersion.objects.create(
                     dataset=dataset,
                     version_label="v1",
@@ -107,57 +168,74 @@ class UploadDatasetView(CreateAPIView):
                     owner=owner,
                 )
 
-                for file in request.FILES.getlist("files"):
-                    file.seek(0)
-                    file_info = upload_datasetfile_to_gcloud(file)
-                    _, ext = os.path.splitext(file.name)
-                    ext = ext.replace(".", "")
-                    metadata: dict[Any, Any] | None = compute_metadata(file)
-                    if metadata is None:
-                        metadata = {}
-
-                    file.seek(0)
-                    md5_hash = hashlib.md5(file.read()).hexdigest()
-                    DatasetFile.objects.create(
+                files_to_create = [
+                    DatasetFile(
                         dataset_version=dataset_version,
-                        upload_id=file_info.name,
-                        upload_url=file_info.public_url or "",
+                        upload_id=file.name,
+                        upload_url="",
                         file_format=ext,
-                        file_size_bytes=file_info.size,
-                        checksum=md5_hash,
+                        file_size_bytes=file.size,
+                        checksum=checksum,
                         owner=owner,
-                        metadata={
-                            "file_info": metadata.get("file_info"),
-                            "structure": metadata.get("structure"),
-                            "extraction_timestamp": metadata.get(
-                                "extraction_timestamp"
-                            ),
-                            "failure_reason": metadata.get("failure_reason"),
-                            "meta_generation_failure": metadata.get(
-                                "meta_generation_failure", False
-                            ),
-                            "meta_generation_failure_timestamp": metadata.get(
-                                "meta_generation_failure_timestamp"
-                            ),
-                        },
-                        column_schema=metadata.get("column_schema", []),
+                        metadata={},
+                        column_schema=[],
+                        upload_status="pending",
                         dataset=dataset,
                     )
+                    for file, checksum, ext in staged_files
+                ]
 
-                dataset.completeness_score = compute_completeness(dataset)
-                dataset.save()
+                # One INSERT per batch instead of one per file; the update
+                # path already inserts this way.
+                DatasetFile.objects.bulk_create(files_to_create, batch_size=100)
 
-                response_data = DatasetSerializer(instance=dataset)
-                return Response(
-                    data={"success": True, "dataset": response_data.data}, status=201
+                # Single-column UPDATE instead of rewriting the whole row we
+                # just inserted; the instance keeps the score for the
+                # response below.
+                dataset.completeness_score = compute_completeness(dataset)
+                Dataset.objects.filter(pk=dataset.pk).update(
+                    completeness_score=dataset.completeness_score
                 )
+
+            # Enqueued after commit so the worker can't pick a task up
+            # before the rows it needs are visible. The GCS transfer and
+            # metadata extraction happen there; upload_status flips to
+            # "ready" per file.
+            for dataset_file, temp_path in zip(
+                files_to_create, temp_paths, strict=True
+            ):
+                process_upload_task(str(dataset_file.id), temp_path)
+
+            # Serialize from the objects already in memory: priming the
+            # prefetch caches means the nested versions/files/tags
+            # serializers read these lists instead of re-querying rows we
+            # just wrote.
+            dataset_version._prefetched_objects_cache = {  # type: ignore[attr-defined]
+                "files": files_to_create
+            }
+            dataset._prefetched_objects_cache = {  # type: ignore[attr-defined]
+                "versions": [dataset_version],
+                "tags": tag_list,
+            }
+            response_data = DatasetSerializer(instance=dataset)
+            return Response(
+                data={"success": True, "dataset": response_data.data}, status=202
+            )
         except ValidationError as e:
+            self._discard_staged(temp_paths)
             return Response(status=400, data=e.detail)
         except Exception:
+            self._discard_staged(temp_paths)
             return Response(
                 status=500, data={"message": "an unexpected error occurred."}
             )
 
+    @staticmethod
+    def _discard_staged(temp_paths: list[str]) -> None:
+        for temp_path in temp_paths:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
 
 class InternalDatasetSearchView(APIView):
     # TODO: user-level Dataset viewing
@@ -177,10 +255,20 @@ class InternalDatasetSearchView(APIView):
 
         secondary_query = Q()
         filters = serializer.validated_data
+        search_vector = None
         if "search" in filters:
-            secondary_query = Q(title__icontains=filters["search"]) | Q(
-                description__icontains=filters["search"]
-            )
+            if connection.vendor == "postgresql":
+                # Matches the GIN expression index from migration 0005, so
+                # the text filter is an index lookup instead of a double
+                # ILIKE '%...%' sequential scan over title+description.
+                search_vector = SearchVector("title", "description", config="english")
+                secondary_query = Q(
+                    search=SearchQuery(filters["search"], config="english")
+                )
+            else:
+                secondary_query = Q(title__icontains=filters["search"]) | Q(
+                    description__icontains=filters["search"]
+                )
 
         if "file_types" in filters:
             secondary_query = secondary_query & Q(
@@ -210,31 +298,48 @@ class InternalDatasetSearchView(APIView):
                 tags__name__in=[tag.lower().strip() for tag in filters["tags"]]
             )
 
-        dataset_query = Dataset.objects.filter(base_query & secondary_query)
+        datasets = Dataset.objects.all()
+        if search_vector is not None:
+            datasets = datasets.annotate(search=search_vector)
+
+        # distinct() matters here: the files/tags joins above can emit the
+        # same dataset once per matching file or tag, which both inflates
+        # the page and repeats serialization work.
+        dataset_query = with_serializer_relations(
+            datasets.filter(base_query & secondary_query).distinct()
+        )
+        # order_by returns a new queryset; the old code discarded it, so
+        # sort_keys never actually sorted anything. The fallback ordering
+        # keeps pagination stable across pages.
         if "sort_keys" in filters:
-            dataset_query.order_by(*filters["sort_keys"])
+            dataset_query = dataset_query.order_by(*filters["sort_keys"])
+        else:
+            dataset_query = dataset_query.order_by("-created_at")
 
         # Save user search query for trending analysis
         if request.user.is_authenticated and "search" in filters:
             try:
-                from trends.analyzers import VertexAITrendingAnalyzer
-                from trends.models import SearchQuery
+                from trends.apps import get_analyzer
+
+                # Aliased: a bare SearchQuery here would shadow the
+                # postgres full-text SearchQuery for the whole function.
+                from trends.models import SearchQuery as SearchQueryLog
 
                 query_text = filters["search"].strip()
                 embedding = None
 
-                # Generate embedding
+                # Generate embedding; the shared analyzer avoids re-running
+                # vertexai.init on the search hot path
                 try:
-                    project_id = getattr(settings, "GOOGLE_CLOUD_PROJECT", None)
-                    if project_id:
-                        analyzer = VertexAITrendingAnalyzer(project_id=project_id)
-                        embeddings = analyzer.encode_queries([(query_text, None)])
-                        if embeddings.size > 0:
-                            embedding = embeddings[0].tolist()
+                    analyzer = get_analyzer()
+                    embeddings = analyzer.encode_queries([(query_text, None)])
+                    if embeddings.size > 0:
+                        # BinaryField stores the raw float32 buffer
+                        embedding = embeddings[0].tobytes()
                 except Exception:
                     pass
 
-                SearchQuery.objects.create(
+                SearchQueryLog.objects.create(
                     user=request.user, query=query_text, embedding=embedding
                 )
             except Exception:
@@ -254,7 +359,7 @@ class UpdateDatasetView(UpdateAPIView):
     lookup_url_kwarg = "id"
 
     def get_queryset(self) -> QuerySet[Dataset]:
-        owner: User = User.objects.get(id=str(self.request.user.id))
+        owner = cast(User, self.request.user)
         return Dataset.objects.filter(owner=owner)
 
     def update(self, request: Request, **kwargs: Any) -> Response:
@@ -283,10 +388,10 @@ class RetrieveDatasetView(RetrieveAPIView):
 
     def get_queryset(self) -> QuerySet[Dataset]:
         if self.request.user.is_authenticated:
-            return Dataset.objects.filter(
-                Q(owner=self.request.user) | Q(is_public=True)
+            return with_serializer_relations(
+                Dataset.objects.filter(Q(owner=self.request.user) | Q(is_public=True))
             )
-        return Dataset.objects.filter(is_public=True)
+        return with_serializer_relations(Dataset.objects.filter(is_public=True))
 
 
 class UpdateDatasetVersion(UpdateAPIView):
@@ -296,7 +401,7 @@ class UpdateDatasetVersion(UpdateAPIView):
     lookup_url_kwarg = "id"
 
     def get_queryset(self) -> QuerySet[DatasetVersion]:
-        owner: User = User.objects.get(id=str(self.request.user.id))
+        owner = cast(User, self.request.user)
         try:
             dataset = Dataset.objects.get(id=self.kwargs.get("id"), owner=owner)
             return DatasetVersion.objects.filter(owner=owner, dataset=dataset)
@@ -308,7 +413,7 @@ class UpdateDatasetVersion(UpdateAPIView):
             ) from e
 
     def update(self, request: Request, **kwargs: Any) -> Response:
-        owner: User = User.objects.get(id=str(request.user.id))
+        owner = cast(User, request.user)
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
@@ -325,49 +430,114 @@ class UpdateDatasetVersion(UpdateAPIView):
 
         try:
             with transaction.atomic():
-                try:
-                    current_version = DatasetVersion.objects.get(
-                        version_number=current_version_number, dataset=dataset
-                    )
-                    latest_version = (
-                        DatasetVersion.objects.filter(dataset=dataset)
-                        .order_by("-version_number")
-                        .first()
-                    )
+                # Only the latest version may be updated, so fetching the
+                # latest row answers both checks with one query on the happy
+                # path (the old code did a get plus an ordered fetch).
+                latest_version = (
+                    DatasetVersion.objects.filter(dataset=dataset)
+                    .order_by("-version_number")
+                    .first()
+                )
+                if (
+                    latest_version is None
+                    or latest_version.version_number != current_version_number
+                ):
                     if (
-                        latest_version
-                        and current_version.version_number
-                        != latest_version.version_number
+                        latest_version is not None
+                        and DatasetVersion.objects.filter(
+                            dataset=dataset, version_number=current_version_number
+                        ).exists()
                     ):
                         raise ValidationError(
                             {
                                 "message": "can only update the latest version of this dataset"
                             }
                         )
-                except DatasetVersion.DoesNotExist as e:
                     raise ValidationError(
                         {"message": "current version does not exist for this dataset"}
-                    ) from e
+                    )
+                current_version = latest_version
 
-                previous_dataset_files_qs = DatasetFile.objects.filter(
-                    dataset_version=current_version
+                # One SELECT covers the previous count, the retained-id
+                # validation and the later iteration; the queryset version
+                # of this ran three separate queries.
+                previous_dataset_files = list(
+                    DatasetFile.objects.filter(dataset_version=current_version)
                 )
-                previous_count = previous_dataset_files_qs.count()
+                previous_count = len(previous_dataset_files)
 
-                dataset_files_to_retain_qs = previous_dataset_files_qs.filter(
-                    id__in=retain_ids
-                )
-                retained_file_ids = list(
-                    dataset_files_to_retain_qs.values_list("id", flat=True)
-                )
+                retain_id_set = set(retain_ids)
+                # Dedupe lookups below become dict hits instead of one
+                # SELECT per uploaded file.
+                previous_by_checksum = {
+                    df.checksum: df for df in previous_dataset_files
+                }
+                retained_files = [
+                    df for df in previous_dataset_files if df.id in retain_id_set
+                ]
+                retained_file_ids = [df.id for df in retained_files]
 
-                if dataset_files_to_retain_qs.count() != len(retain_ids):
+                if len(retained_files) != len(retain_ids):
                     raise ValidationError(
                         {
                             "message": "one or more dataset_file ids to retain are missing or invalid"
                         }
                     )
 
+                # Hash everything up front (memory-speed, parallel across
+                # files) so an identical-content retry is rejected before a
+                # single byte goes to GCS; previously the no-op check ran
+                # after all uploads had already happened.
+                uploaded_files = request.FILES.getlist("files", [])
+                if len(uploaded_files) > 1:
+                    with ThreadPoolExecutor(
+                        max_workers=min(8, len(uploaded_files))
+                    ) as executor:
+                        upload_checksums = list(
+                            executor.map(compute_checksum, uploaded_files)
+                        )
+                else:
+                    upload_checksums = [
+                        compute_checksum(file) for file in uploaded_files
+                    ]
+
+                # The same content twice in one request would trip the
+                # unique_checksum_per_version constraint at bulk_create;
+                # keep the first copy, like the upload view does.
+                seen_checksums: set[str] = set()
+                deduped_files = []
+                deduped_checksums = []
+                for uploaded_file, checksum_hex in zip(
+                    uploaded_files, upload_checksums, strict=True
+                ):
+                    if checksum_hex in seen_checksums:
+                        continue
+                    seen_checksums.add(checksum_hex)
+                    deduped_files.append(uploaded_file)
+                    deduped_checksums.append(checksum_hex)
+                uploaded_files = deduped_files
+                upload_checksums = deduped_checksums
+
+                creates_new_content = any(
+                    checksum not in previous_by_checksum
+                    for checksum in upload_checksums
+                )
+                reused_appends = sum(
+                    1
+                    for checksum in upload_checksums
+                    if checksum in previous_by_checksum
+                    and previous_by_checksum[checksum].id not in retain_id_set
+                )
+                if (
+                    not creates_new_content
+                    and len(retained_files) + reused_appends == previous_count
+                ):
+                    raise ValidationError(
+                        {
+                            "message": "attempt to create new version causes the same state as previous version"
+                        }
+                    )
+
                 new_version_number = current_version.version_number + 1
                 new_version = DatasetVersion.objects.create(
                     dataset=dataset,
@@ -391,19 +561,18 @@ class UpdateDatasetVersion(UpdateAPIView):
                         column_schema=df.column_schema,
                         dataset=dataset,
                     )
-                    for df in dataset_files_to_retain_qs
+                    for df in retained_files
                 ]
 
                 new_dataset_files = []
-                for uploaded_file in request.FILES.getlist("files", []):
-                    # seek before making md5 to make sure the md5 is correct
-                    uploaded_file.seek(0)
-                    md5_hex = hashlib.md5(uploaded_file.read()).hexdigest()
-                    existing_dataset_file = DatasetFile.objects.filter(
-                        dataset_version=current_version, checksum=md5_hex
-                    ).first()
+                for uploaded_file, checksum_hex in zip(
+                    uploaded_files, upload_checksums, strict=True
+                ):
+                    existing_dataset_file = previous_by_checksum.get(checksum_hex)
 
                     if existing_dataset_file:
+                        # Same content already stored: reuse its blob, no
+                        # upload needed.
                         if existing_dataset_file.id not in retained_file_ids:
                             dataset_files.append(
                                 DatasetFile(
@@ -425,48 +594,37 @@ class UpdateDatasetVersion(UpdateAPIView):
                     file_info = upload_datasetfile_to_gcloud(uploaded_file)
                     _, ext = os.path.splitext(uploaded_file.name)
                     ext = ext.lstrip(".")
-                    metadata = compute_metadata(uploaded_file) or {}
                     dataset_file = DatasetFile(
                         dataset_version=new_version,
                         upload_id=file_info.name,
                         upload_url=file_info.public_url or "",
                         file_format=ext,
                         file_size_bytes=file_info.size,
-                        checksum=md5_hex,
+                        checksum=checksum_hex,
                         owner=owner,
-                        metadata={
-                            "file_info": metadata.get("file_info"),
-                            "structure": metadata.get("structure"),
-                            "extraction_timestamp": metadata.get(
-                                "extraction_timestamp"
-                            ),
-                            "failure_reason": metadata.get("failure_reason"),
-                            "meta_generation_failure": metadata.get(
-                                "meta_generation_failure", False
-                            ),
-                            "meta_generation_failure_timestamp": metadata.get(
-                                "meta_generation_failure_timestamp"
-                            ),
-                        },
-                        column_schema=metadata.get("column_schema", []),
+                        metadata={},
+                        column_schema=[],
                         dataset=dataset,
                     )
 
                     new_dataset_files.append(dataset_file)
 
-                # make sure that creating this new version, does not end up the same as old version
-                # this means that new_dataset_files is not empty or the length of retained dataset files
-                # is not the same as the current version that exists.
-                if not new_dataset_files and len(dataset_files) == previous_count:
-                    raise ValidationError(
-                        {
-                            "message": "attempt to create new version causes the same state as previous version"
-                        }
-                    )
-
+                # The same-state case was already rejected before any upload
+                # happened (checksum pre-check above), so no second check is
+                # needed here.
                 dataset_files.extend(new_dataset_files)
                 DatasetFile.objects.bulk_create(dataset_files)
-                new_version.refresh_from_db()
+                # Fill metadata for freshly uploaded files off the request
+                # thread; retained/deduplicated files already carry theirs.
+                for dataset_file in new_dataset_files:
+                    compute_metadata_task(str(dataset_file.id))
+
+                # The serializer only needs the files relation on top of
+                # fields we already hold; hand it the created list instead
+                # of re-selecting the row and its files.
+                new_version._prefetched_objects_cache = {  # type: ignore[attr-defined]
+                    "files": dataset_files
+                }
 
                 response_serializer = DatasetVersionSerializer(instance=new_version)
                 return Response(data=response_serializer.data, status=201)
@@ -489,7 +647,7 @@ class DeleteDatasetView(DestroyAPIView):
 
     def destroy(self, request: Request, **kwargs: Any) -> Response:
         dataset_id: str = kwargs.get("id", "")
-        owner: User = User.objects.get(id=str(request.user.id))
+        owner = cast(User, request.user)
         try:
             dataset = Dataset.objects.get(id=dataset_id, owner=owner)
         except Dataset.DoesNotExist as e:
@@ -515,7 +673,7 @@ class DeleteDatasetVersionView(DestroyAPIView):
 
     def destroy(self, request: Request, **kwargs: Any) -> Response:
         dataset_version_id: str = kwargs.get("id", "")
-        owner: User = User.objects.get(id=str(request.user.id))
+        owner = cast(User, request.user)
         try:
             dataset_version = DatasetVersion.objects.get(
                 id=dataset_version_id, owner=owner
@@ -544,7 +702,7 @@ class DeleteDatasetFileView(DestroyAPIView):
     serializer_class = EmptySerializer
 
     def destroy(self, request: Request, **kwargs: Any) -> Response:
-        owner: User = User.objects.get(id=str(request.user.id))
+        owner = cast(User, request.user)
         dataset_file_id: str = kwargs.get("id", "")
         try:
             dataset_file = DatasetFile.objects.get(id=dataset_file_id, owner=owner)
@@ -588,7 +746,7 @@ class DownloadDatasetFileView(APIView):
                     "download_file_email.html",
                     {"download_link": download_url, "expire_time": expiration_time},
                 )
-                send_email(
+                send_email_task(
                     emails=[send_to_email], subject=subject, content=html_message
                 )
                 return Response(
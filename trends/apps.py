@@ -1,9 +1,60 @@
 import logging
+import threading
+from typing import TYPE_CHECKING
 
 from django.apps import AppConfig
+from django.conf import settings
+
+if TYPE_CHECKING:
+    from trends.analyzers import VertexAITrendingAnalyzer
 
 logger = logging.getLogger(__name__)
 
+_analyzer: "VertexAITrendingAnalyzer | None" = None
+_analyzer_lock = threading.Lock()
+
+# Some runners invoke AppConfig.ready() more than once; the sentinel keeps
+# startup work (warmup thread spawn) single-shot.
+_ready_ran = False
+
+
+def get_analyzer() -> "VertexAITrendingAnalyzer":
+    """Return the process-wide Vertex AI analyzer, creating it on first use.
+
+    vertexai.init and TextEmbeddingModel.from_pretrained are paid exactly
+    once per process; concurrent first requests are serialized by the lock
+    and every later caller shares the resolved SDK client. The analyzer
+    import stays inside the function so app startup doesn't pull in the
+    Vertex SDK.
+    """
+    global _analyzer
+    if _analyzer is None:
+        with _analyzer_lock:
+            if _analyzer is None:
+                from trends.analyzers import VertexAITrendingAnalyzer
+
+                project_id = getattr(settings, "GOOGLE_CLOUD_PROJECT", None)
+                if not project_id:
+                    raise ValueError("GOOGLE_CLOUD_PROJECT setting is required")
+
+                _analyzer = VertexAITrendingAnalyzer(
+                    project_id=project_id,
+                    location=getattr(settings, "VERTEX_AI_LOCATION", "us-central1"),
+                    model_name=getattr(
+                        settings, "VERTEX_AI_MODEL", "text-multilingual-embedding-002"
+                    ),
+                )
+    return _analyzer
+
+
+def _warm_analyzer() -> None:
+    try:
+        get_analyzer()
+        logger.info("Vertex AI analyzer warmed up in background thread")
+    except Exception as e:
+        # Warmup is best-effort; the first request retries via get_analyzer
+        logger.warning(f"Vertex AI analyzer warmup failed: {e}")
+
 
 class TrendsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
@@ -11,6 +62,21 @@ class TrendsConfig(AppConfig):
 
     def ready(self) -> None:
         """App initialization hook. Vertex AI analyzer now uses lazy loading."""
+        global _ready_ran
+        if _ready_ran:
+            return
+        _ready_ran = True
+
+        if getattr(settings, "TRENDS_WARMUP_ASYNC", False):
+            # Pre-resolve the SDK client without blocking worker boot (or
+            # the readiness probe); get_analyzer's lock makes a concurrent
+            # first request and the warmup thread initialize exactly once.
+            threading.Thread(
+                target=_warm_analyzer,
+                daemon=True,
+                name="trends-analyzer-warmup",
+            ).start()
+            return
         logger.info(
             "Trends app ready. Vertex AI will initialize on first request (lazy loading)."
         )
@@ -1,10 +1,14 @@
+import itertools
 import random
-from datetime import datetime, timedelta
+from datetime import timedelta
 from typing import Any
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.core.management.base import BaseCommand, CommandParser
+from django.db import transaction
+from django.db.models import Count
+from django.utils import timezone
 
 from trends.analyzers import VertexAITrendingAnalyzer
 from trends.models import SearchQuery
@@ -247,44 +251,47 @@ class Command(BaseCommand):
             "grace.researcher@think-tank.ng": ["healthcare", "economy", "education"],
         }
 
-        # Generate queries
-        created_count = 0
-        base_time = datetime.now() - timedelta(days=30)
+        # Hoisted lookup tables: the generation loop draws from these
+        # immutable structures instead of rebuilding key/weight lists on
+        # every iteration. cum_weights also lets random.choices skip its
+        # internal prefix-sum pass.
+        category_names = tuple(search_patterns)
+        cum_weights = list(
+            itertools.accumulate(
+                float(pattern["weight"]) for pattern in search_patterns.values()
+            )
+        )
+        query_pool = {
+            category: tuple(pattern["queries"])
+            for category, pattern in search_patterns.items()
+        }
+        locations = ("lagos", "abuja", "kano", "rivers", "ogun", "kaduna", "oyo")
+
+        # Generate queries, accumulating instances for one bulk insert
+        # instead of a round-trip per row
+        search_queries = []
+        # Aware base time: created_at is stored now that bulk_create sets
+        # it, and naive datetimes warn (and skew) under USE_TZ.
+        base_time = timezone.now() - timedelta(days=30)
 
         for _ in range(total_queries):
             # Select user
             user = random.choice(users)
 
             # Get user's preferred categories or use all categories
-            preferred_categories = user_preferences.get(
-                user.email, list(search_patterns.keys())
-            )
+            preferred_categories = user_preferences.get(user.email, category_names)
 
             # Choose category (with some randomness)
             if random.random() < 0.7:  # 70% chance to use preferred category
                 category = random.choice(preferred_categories)
             else:  # 30% chance to use any category
-                category = random.choices(
-                    list(search_patterns.keys()),
-                    weights=[
-                        float(pattern["weight"]) for pattern in search_patterns.values()
-                    ],
-                )[0]
+                category = random.choices(category_names, cum_weights=cum_weights)[0]
 
             # Choose query from category
-            query: str = random.choice(search_patterns[category]["queries"])
+            query: str = random.choice(query_pool[category])
 
             # Add location variation (20% chance)
             if random.random() < 0.2:
-                locations = [
-                    "lagos",
-                    "abuja",
-                    "kano",
-                    "rivers",
-                    "ogun",
-                    "kaduna",
-                    "oyo",
-                ]
                 query += f" {random.choice(locations)}"
 
             # Generate realistic timestamp
@@ -303,7 +310,8 @@ class Command(BaseCommand):
                     # We'll pass a list of (query, None) to match the expected signature.
                     embeddings = self.analyzer.encode_queries([(query, None)])
                     if embeddings.size > 0:
-                        embedding = embeddings[0].tolist()
+                        # BinaryField stores the raw float32 buffer
+                        embedding = embeddings[0].tobytes()
                 except Exception as e:
                     self.stderr.write(
                         self.style.WARNING(
@@ -311,12 +319,18 @@ class Command(BaseCommand):
                         )
                     )
 
-            SearchQuery.objects.create(
-                user=user, query=query, embedding=embedding, created_at=created_at
+            search_queries.append(
+                SearchQuery(
+                    user=user, query=query, embedding=embedding, created_at=created_at
+                )
             )
-            created_count += 1
 
-        self.stdout.write(self.style.SUCCESS(f"Created {created_count} search queries"))
+        with transaction.atomic():
+            SearchQuery.objects.bulk_create(search_queries, batch_size=1000)
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Created {len(search_queries)} search queries")
+        )
 
         # Show summary
         self.show_summary()
@@ -333,22 +347,27 @@ class Command(BaseCommand):
         self.stdout.write(f"Total users: {total_users}")
         self.stdout.write(f"Total search queries: {total_queries}")
 
-        # Show queries per user
+        # Show queries per user: one GROUP BY instead of a COUNT per user
         self.stdout.write("\nQueries per user:")
-        for user in User.objects.all():
-            count = SearchQuery.objects.filter(user=user).count()
-            if count > 0:
-                self.stdout.write(f"  {user.email}: {count} queries")
+        per_user = (
+            SearchQuery.objects.values("user__email")
+            .annotate(count=Count("id"))
+            .order_by("-count")
+        )
+        for user_row in per_user:
+            self.stdout.write(
+                f"  {user_row['user__email']}: {user_row['count']} queries"
+            )
 
-        # Show top queries
+        # Show top queries, counted in the database as well
         self.stdout.write("\nTop 10 most searched queries:")
-        from collections import Counter
-
-        queries = SearchQuery.objects.values_list("query", flat=True)
-        query_counts = Counter(queries)
-
-        for query, count in query_counts.most_common(10):
-            self.stdout.write(f'  "{query}": {count} times')
+        top_queries = (
+            SearchQuery.objects.values("query")
+            .annotate(count=Count("id"))
+            .order_by("-count")[:10]
+        )
+        for query_row in top_queries:
+            self.stdout.write(f'  "{query_row["query"]}": {query_row["count"]} times')
 
         self.stdout.write("\n✅ Dummy data created successfully!")
         self.stdout.write(
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.17 on 2026-08-31 20:17
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("trends", "0002_searchquery_embedding"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="searchquery",
+            name="created_at",
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+    ]
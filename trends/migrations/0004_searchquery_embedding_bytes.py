@@ -0,0 +1,67 @@
+from django.db import migrations, models
+from django.db.backends.base.schema import BaseDatabaseSchemaEditor
+from django.db.migrations.state import StateApps
+
+BATCH_SIZE = 500
+
+
+def json_to_bytes(apps: StateApps, schema_editor: BaseDatabaseSchemaEditor) -> None:
+    import numpy as np
+
+    SearchQuery = apps.get_model("trends", "SearchQuery")
+    batch = []
+    for row in (
+        SearchQuery.objects.exclude(embedding__isnull=True)
+        .only("id", "embedding")
+        .iterator()
+    ):
+        row.embedding_bytes = np.asarray(row.embedding, dtype=np.float32).tobytes()
+        batch.append(row)
+        if len(batch) >= BATCH_SIZE:
+            SearchQuery.objects.bulk_update(batch, ["embedding_bytes"])
+            batch = []
+    if batch:
+        SearchQuery.objects.bulk_update(batch, ["embedding_bytes"])
+
+
+def bytes_to_json(apps: StateApps, schema_editor: BaseDatabaseSchemaEditor) -> None:
+    import numpy as np
+
+    SearchQuery = apps.get_model("trends", "SearchQuery")
+    batch = []
+    for row in (
+        SearchQuery.objects.exclude(embedding_bytes__isnull=True)
+        .only("id", "embedding_bytes")
+        .iterator()
+    ):
+        row.embedding = np.frombuffer(row.embedding_bytes, dtype=np.float32).tolist()
+        batch.append(row)
+        if len(batch) >= BATCH_SIZE:
+            SearchQuery.objects.bulk_update(batch, ["embedding"])
+            batch = []
+    if batch:
+        SearchQuery.objects.bulk_update(batch, ["embedding"])
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("trends", "0003_alter_searchquery_created_at"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="searchquery",
+            name="embedding_bytes",
+            field=models.BinaryField(blank=True, null=True),
+        ),
+        migrations.RunPython(json_to_bytes, bytes_to_json),
+        migrations.RemoveField(
+            model_name="searchquery",
+            name="embedding",
+        ),
+        migrations.RenameField(
+            model_name="searchquery",
+            old_name="embedding_bytes",
+            new_name="embedding",
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.17 on 2026-08-31 20:21
+
+import django.db.models.functions.text
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("trends", "0004_searchquery_embedding_bytes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="searchquery",
+            index=models.Index(
+                django.db.models.functions.text.Lower(
+                    django.db.models.functions.text.Trim("query")
+                ),
+                name="sq_cleaned_idx",
+            ),
+        ),
+    ]
@@ -1,31 +1,74 @@
 import logging
 from datetime import timedelta
+from typing import TYPE_CHECKING
 
-from django.db import models
+from django.db import connection, models
+from django.db.models.functions import Length, Lower, Trim
 from django.utils import timezone
 
 from users.models import User
 
+if TYPE_CHECKING:
+    import numpy as np
+
 logger = logging.getLogger(__name__)
 
 
 class SearchQueryManager(models.Manager):
-    def get_recent_queries(self, days: int) -> list[tuple[str, list[float] | None]]:
-        """Extract, clean, and deduplicate recent search queries, returning (query, embedding) tuples."""
+    def get_recent_queries(
+        self, days: int, embedded_only: bool = False
+    ) -> "list[tuple[str, np.ndarray | None]]":
+        """Extract, clean, and deduplicate recent search queries, returning (query, embedding) tuples.
+
+        With embedded_only the rows still lacking an embedding are filtered
+        out in the database, so their bytes never cross the wire; the
+        default keeps them because the analyzers backfill missing
+        embeddings through Vertex AI.
+        """
+        # Deferred so importing the models module doesn't pull numpy into
+        # every management command's boot path.
+        import numpy as np
+
         try:
             cutoff_date = timezone.now() - timedelta(days=days)
-            query_data = self.filter(created_at__gte=cutoff_date).values_list(
-                "query", "embedding"
-            )
+            recent = self.filter(created_at__gte=cutoff_date)
+            if embedded_only:
+                recent = recent.exclude(embedding__isnull=True)
 
-            seen = set()
-            unique_queries_with_embeddings = []
-            for query, embedding in query_data:
-                if isinstance(query, str):
-                    cleaned = query.lower().strip()
-                    if 3 < len(cleaned) <= 200 and cleaned not in seen:
-                        seen.add(cleaned)
-                        unique_queries_with_embeddings.append((cleaned, embedding))
+            if connection.vendor == "postgresql":
+                # Clean, length-filter and deduplicate server-side: DISTINCT
+                # ON ships one row per cleaned query (the most recent one)
+                # instead of every raw row.
+                query_data = (
+                    recent.annotate(cleaned=Lower(Trim("query")))
+                    .annotate(cleaned_length=Length("cleaned"))
+                    .filter(cleaned_length__gt=3, cleaned_length__lte=200)
+                    .order_by("cleaned", "-created_at")
+                    .distinct("cleaned")
+                    .values_list("cleaned", "embedding")
+                )
+                unique_queries_with_embeddings = [
+                    (
+                        query,
+                        np.frombuffer(embedding, dtype=np.float32)
+                        if embedding is not None
+                        else None,
+                    )
+                    for query, embedding in query_data
+                ]
+            else:
+                # sqlite dev fallback has no DISTINCT ON; clean in Python
+                query_data = recent.values_list("query", "embedding")
+                seen = set()
+                unique_queries_with_embeddings = []
+                for query, embedding in query_data:
+                    if isinstance(query, str):
+                        cleaned = query.lower().strip()
+                        if 3 < len(cleaned) <= 200 and cleaned not in seen:
+                            seen.add(cleaned)
+                            if embedding is not None:
+                                embedding = np.frombuffer(embedding, dtype=np.float32)
+                            unique_queries_with_embeddings.append((cleaned, embedding))
 
             logger.info(
                 f"Extracted {len(unique_queries_with_embeddings)} unique user search queries for analysis"
@@ -35,16 +78,41 @@ class SearchQueryManager(models.Manager):
             logger.error(f"Error extracting user search queries: {e}", exc_info=True)
             return []
 
+    def get_missing_embeddings(self, days: int) -> list[tuple[int, str]]:
+        """Return (id, query) for recent rows that still lack an embedding.
+
+        Cheap companion to get_recent_queries(embedded_only=True) for a
+        backfill pass: only the ids and query text are fetched, never the
+        embedding column.
+        """
+        cutoff_date = timezone.now() - timedelta(days=days)
+        return list(
+            self.filter(
+                created_at__gte=cutoff_date, embedding__isnull=True
+            ).values_list("id", "query")
+        )
+
 
 class SearchQuery(models.Model):
     user = models.ForeignKey(
         User, on_delete=models.CASCADE, related_name="search_queries"
     )
     query = models.TextField()
-    embedding = models.JSONField(null=True, blank=True)
-    created_at = models.DateTimeField(auto_now_add=True)
+    # Raw float32 bytes (4 bytes per dimension) instead of a JSON array of
+    # decimal strings: ~5x smaller rows and decoding is one frombuffer call
+    embedding = models.BinaryField(null=True, blank=True)
+    # default instead of auto_now_add so bulk seeding (and backfills) can
+    # set explicit timestamps; normal inserts still stamp creation time
+    created_at = models.DateTimeField(default=timezone.now)
 
     objects = SearchQueryManager()
 
+    class Meta:
+        indexes = [
+            # Backs the DISTINCT ON (lower(btrim(query))) dedup pass in
+            # get_recent_queries
+            models.Index(Lower(Trim("query")), name="sq_cleaned_idx"),
+        ]
+
     def __str__(self) -> str:
         return f"{self.user.email}: {self.query}"
@@ -1,13 +1,15 @@
-from typing import Any
-
 from rest_framework import serializers
 
 
 class SimilarQueriesRequestSerializer(serializers.Serializer):
     """Serializer for similar queries request data."""
 
+    # CharField strips surrounding whitespace (trim_whitespace), so no
+    # per-query strip pass is needed after the fields run. Blank entries
+    # are allowed through field validation and silently dropped below,
+    # keeping the lenient contract for clients that send padding rows.
     queries = serializers.ListField(
-        child=serializers.CharField(max_length=500, min_length=1),
+        child=serializers.CharField(max_length=500, allow_blank=True),
         min_length=1,
         max_length=1000,
         help_text="List of candidate queries to search within",
@@ -26,29 +28,11 @@ class SimilarQueriesRequestSerializer(serializers.Serializer):
         help_text="Number of similar queries to return (1-100)",
     )
 
-    def validate(self, attrs: dict[str, Any]) -> dict[str, Any]:
-        """Cross-field validation."""
-        queries = attrs.get("queries", [])
-        target_query = attrs.get("target_query", "")
-
-        # Clean queries
-        cleaned_queries = [q.strip() for q in queries if q.strip()]
-        cleaned_target = target_query.strip()
-
-        if not cleaned_queries:
-            raise serializers.ValidationError(
-                {"queries": "At least one valid query is required."}
-            )
-
-        if not cleaned_target:
-            raise serializers.ValidationError(
-                {"target_query": "Target query cannot be empty."}
-            )
-
-        attrs["queries"] = cleaned_queries
-        attrs["target_query"] = cleaned_target
-
-        return attrs
+    def validate_queries(self, value: list[str]) -> list[str]:
+        cleaned = [query for query in value if query]
+        if not cleaned:
+            raise serializers.ValidationError("At least one valid query is required.")
+        return cleaned
 
 
 class TrendingCategorySerializer(serializers.Serializer):
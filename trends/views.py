@@ -10,6 +10,7 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from trends.analyzers import VertexAITrendingAnalyzer
+from trends.apps import get_analyzer
 from trends.models import SearchQuery
 from trends.serializers import (
     ErrorResponseSerializer,
@@ -25,27 +26,15 @@ logger = logging.getLogger(__name__)
 class BaseVertexAIView(APIView):
     """Base view with shared Vertex AI analyzer initialization."""
 
-    _analyzer: VertexAITrendingAnalyzer | None = None
-
     @property
     def analyzer(self) -> VertexAITrendingAnalyzer:
-        if self._analyzer is None:
-            try:
-                project_id = getattr(settings, "GOOGLE_CLOUD_PROJECT", None)
-                if not project_id:
-                    raise ValueError("GOOGLE_CLOUD_PROJECT setting is required")
-
-                self._analyzer = VertexAITrendingAnalyzer(
-                    project_id=project_id,
-                    location=getattr(settings, "VERTEX_AI_LOCATION", "us-central1"),
-                    model_name=getattr(
-                        settings, "VERTEX_AI_MODEL", "text-multilingual-embedding-002"
-                    ),
-                )
-            except Exception as e:
-                logger.error(f"Failed to initialize Vertex AI analyzer: {e}")
-                raise
-        return self._analyzer
+        # DRF constructs a fresh view instance per request, so the analyzer
+        # lives in trends.apps module state rather than on the view.
+        try:
+            return get_analyzer()
+        except Exception as e:
+            logger.error(f"Failed to initialize Vertex AI analyzer: {e}")
+            raise
 
 
 @extend_schema_view(
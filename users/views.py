@@ -18,7 +18,7 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from core.config import application_config
-from core.utils import EmptySerializer, extract_base_url, send_email
+from core.utils import EmptySerializer, extract_base_url, send_email_task
 from users.models import User
 from users.permissions import is_accessible
 from users.serializers import (
@@ -141,7 +141,7 @@ class GoogleAuthCallbackView(APIView):
                         "user_name": f"{user_profile['given_name']} {user_profile['family_name']}"
                     },
                 )
-                send_email(
+                send_email_task(
                     emails=[user_profile["email"]],
                     subject="Welcome to Nigerian Datasets!",
                     content=html_message,
@@ -187,7 +187,7 @@ class RegisterUserView(CreateAPIView):
         html_message = render_to_string(
             "welcome_email.html", {"user_name": f"{first_name} {last_name}"}
         )
-        send_email(
+        send_email_task(
             emails=[email],
             subject="Welcome to Nigerian Datasets!",
             content=html_message,